@@ -1,15 +1,52 @@
 
 # todo_backend.py
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context, g
 from flask_cors import CORS
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import heapq
 import json
+import math
+import mmap
+import os
+import threading
+import time
+
+# Use orjson for encoding when it is installed, fall back to stdlib json
+try:
+    import orjson
+
+    def encode_json(data):
+        return orjson.dumps(data).decode('utf-8')
+except ImportError:
+    def encode_json(data):
+        return json.dumps(data)
 
 # Initialize Flask application
 app = Flask(__name__)
 # Enable CORS to allow frontend to communicate with backend
 CORS(app)
 
+def parse_timestamp(value):
+    """
+    Parse an ISO 8601 timestamp into a naive local datetime
+    Raises ValueError if malformed
+    """
+    parsed = datetime.fromisoformat(value)
+    # Compare everything in local time like created_at
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+def parse_due_at(value):
+    """
+    Parse an ISO 8601 due date into a naive local datetime
+    Returns None for empty values, raises ValueError if malformed
+    """
+    if not value:
+        return None
+    return parse_timestamp(value)
+
 # =====================================================
 # DATA STRUCTURES IMPLEMENTATION
 # =====================================================
@@ -19,14 +56,19 @@ class TodoNode:
     Node class for implementing linked list structure
     Each node contains task data and pointer to next node
     """
-    def __init__(self, task_id, title, description, priority="medium", completed=False):
+    def __init__(self, task_id, title, description, priority="medium", completed=False, due_at=None):
         self.task_id = task_id          # Unique identifier for the task
         self.title = title              # Task title
         self.description = description  # Task description
         self.priority = priority        # Priority level (low, medium, high)
         self.completed = completed      # Completion status
         self.created_at = datetime.now().isoformat()  # Timestamp
+        self.completed_at = None       # Set when task is marked completed
+        self.due_at = due_at or None   # Optional deadline (ISO 8601), "" means none
+        self.overdue = False           # Set by TodoDueScheduler when due_at passes
+        self.due_seq = None            # Scheduler entry currently valid for this node
         self.next = None               # Pointer to next node in linked list
+        self.json_cache = None         # Cached JSON encoding of to_dict()
 
     def to_dict(self):
         """Convert node data to dictionary for JSON serialization"""
@@ -36,9 +78,20 @@ class TodoNode:
             'description': self.description,
             'priority': self.priority,
             'completed': self.completed,
-            'created_at': self.created_at
+            'created_at': self.created_at,
+            'due_at': self.due_at,
+            'overdue': self.overdue
         }
 
+    def to_json(self):
+        """
+        Return node data as a JSON string, encoding only on first use
+        The cache is cleared by TodoLinkedList.update_task
+        """
+        if self.json_cache is None:
+            self.json_cache = encode_json(self.to_dict())
+        return self.json_cache
+
 class TodoLinkedList:
     """
     Linked List implementation for storing todo tasks
@@ -48,13 +101,14 @@ class TodoLinkedList:
         self.head = None        # Points to first node
         self.size = 0          # Track number of nodes
         self.next_id = 1       # Auto-increment ID counter
+        self.scheduler = TodoDueScheduler()  # Due date index
 
-    def add_task(self, title, description, priority="medium"):
+    def add_task(self, title, description, priority="medium", due_at=None):
         """
         Add new task to the beginning of linked list (O(1) operation)
         """
         # Create new node with auto-incremented ID
-        new_node = TodoNode(self.next_id, title, description, priority)
+        new_node = TodoNode(self.next_id, title, description, priority, due_at=due_at)
         
         # Insert at head of linked list
         new_node.next = self.head
@@ -64,6 +118,9 @@ class TodoLinkedList:
         self.next_id += 1
         self.size += 1
         
+        # Register deadline with the scheduler
+        self.scheduler.reschedule(new_node)
+        
         return new_node.to_dict()
 
     def get_all_tasks(self):
@@ -81,6 +138,51 @@ class TodoLinkedList:
             
         return tasks
 
+    def get_all_nodes(self):
+        """
+        Traverse entire linked list and return all nodes as array
+        Time complexity: O(n)
+        """
+        return list(self.iter_nodes())
+
+    def iter_nodes(self):
+        """
+        Generator over the linked list - yields one node at a time
+        Time complexity: O(n) overall, O(1) memory
+        """
+        current = self.head
+        
+        # Yield from head to tail without building a list
+        while current:
+            yield current
+            current = current.next
+
+    def add_tasks_batch(self, batch):
+        """
+        Insert a batch of task dicts at the head of the linked list
+        Time complexity: O(k) for a batch of k tasks
+        """
+        for data in batch:
+            new_node = TodoNode(
+                self.next_id,
+                data['title'],
+                data.get('description', ''),
+                data.get('priority', 'medium'),
+                data.get('completed', False),
+                data.get('due_at')
+            )
+            # Keep original timestamp when restoring from an export
+            if data.get('created_at'):
+                new_node.created_at = parse_timestamp(data['created_at']).isoformat()
+            
+            new_node.next = self.head
+            self.head = new_node
+            self.next_id += 1
+            self.size += 1
+            self.scheduler.reschedule(new_node)
+            
+        return len(batch)
+
     def find_task(self, task_id):
         """
         Search for task by ID in linked list
@@ -96,7 +198,8 @@ class TodoLinkedList:
             
         return None
 
-    def update_task(self, task_id, title=None, description=None, priority=None, completed=None):
+    def update_task(self, task_id, title=None, description=None, priority=None, completed=None,
+                    due_at=None):
         """
         Update existing task properties
         Time complexity: O(n) for search + O(1) for update
@@ -106,6 +209,9 @@ class TodoLinkedList:
         if not task_node:
             return None
             
+        # Remember scheduling fields to detect deadline changes
+        previous_schedule = (task_node.completed, task_node.due_at)
+            
         # Update only provided fields
         if title is not None:
             task_node.title = title
@@ -114,7 +220,22 @@ class TodoLinkedList:
         if priority is not None:
             task_node.priority = priority
         if completed is not None:
+            # Record when the task was completed (used for archiving)
+            if completed and not task_node.completed:
+                task_node.completed_at = datetime.now().isoformat()
+            elif not completed:
+                task_node.completed_at = None
             task_node.completed = completed
+        if due_at is not None:
+            # Empty string clears the deadline
+            task_node.due_at = due_at or None
+        
+        # Re-index deadline only if it changed (completed tasks are never overdue)
+        if (task_node.completed, task_node.due_at) != previous_schedule:
+            self.scheduler.reschedule(task_node)
+        
+        # Invalidate cached JSON so the next read re-encodes
+        task_node.json_cache = None
             
         return task_node.to_dict()
 
@@ -129,6 +250,7 @@ class TodoLinkedList:
             
         # Handle deletion of head node
         if self.head.task_id == task_id:
+            self.scheduler.unschedule(self.head)
             self.head = self.head.next
             self.size -= 1
             return True
@@ -138,6 +260,7 @@ class TodoLinkedList:
         while current.next:
             if current.next.task_id == task_id:
                 # Remove node by updating pointer
+                self.scheduler.unschedule(current.next)
                 current.next = current.next.next
                 self.size -= 1
                 return True
@@ -145,6 +268,255 @@ class TodoLinkedList:
             
         return False
 
+    def archive_completed(self, archive, cutoff):
+        """
+        Move completed tasks finished before cutoff into the archive
+        Time complexity: O(n) single pass
+        """
+        moved = 0
+        prev = None
+        current = self.head
+        
+        # Open the segment once for the whole pass
+        with archive:
+            while current:
+                next_node = current.next
+                # Fall back to created_at for tasks without a completion time
+                finished_at = current.completed_at or current.created_at
+                
+                if current.completed and parse_timestamp(finished_at) < cutoff:
+                    self.scheduler.unschedule(current)
+                    archive.append(current)
+                    # Unlink node from the list
+                    if prev:
+                        prev.next = next_node
+                    else:
+                        self.head = next_node
+                    self.size -= 1
+                    moved += 1
+                else:
+                    prev = current
+                current = next_node
+            
+        return moved
+
+class TodoArchive:
+    """
+    Append-only on-disk segment for archived (cold) tasks
+    Each task is one JSON line. Records are keyed by their position in the
+    segment (task_ids can repeat across restarts and imports), with an
+    index from task_id to positions; reads go through a memory map
+    Use as a context manager to open the segment once per archiving pass
+    """
+    def __init__(self, path):
+        self.path = path
+        self.entries = []       # position -> (offset, length), in archive order
+        self.index = {}         # task_id -> [positions]
+        self.mapped = None      # Memory map, reopened after appends
+        self.writer = None      # Open segment file during an archiving pass
+        self.lock = threading.RLock()  # Held for a whole archiving pass and each read
+        self.load_index()
+
+    def load_index(self):
+        """
+        Rebuild the index by scanning an existing segment file
+        A truncated or corrupt tail (e.g. after a crash) is cut off
+        """
+        if not os.path.exists(self.path):
+            return
+        
+        offset = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError('truncated record')
+                    task_id = json.loads(line)['task_id']
+                except (ValueError, KeyError, TypeError):
+                    break
+                self.add_entry(task_id, offset, len(line) - 1)
+                offset += len(line)
+        
+        # Drop anything after the last good record so appends stay aligned
+        if offset < os.path.getsize(self.path):
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset)
+
+    def add_entry(self, task_id, offset, length):
+        """Record one segment entry in the position list and task_id index"""
+        self.index.setdefault(task_id, []).append(len(self.entries))
+        self.entries.append((offset, length))
+
+    def __enter__(self):
+        # Readers wait until the pass is finished and remapped
+        self.lock.acquire()
+        try:
+            self.writer = open(self.path, 'ab')
+        except OSError:
+            self.lock.release()
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            self.writer.close()
+            self.writer = None
+            # Remap once so the next read sees this pass's appends
+            self.close()
+        finally:
+            self.lock.release()
+
+    def append(self, node):
+        """
+        Write node's JSON to the end of the open segment
+        Time complexity: O(1)
+        """
+        data = node.to_json().encode('utf-8')
+        offset = self.writer.tell()
+        self.writer.write(data + b'\n')
+        self.add_entry(node.task_id, offset, len(data))
+
+    def read(self, position):
+        """
+        Return the archived JSON string at position, or None
+        Time complexity: O(1)
+        """
+        with self.lock:
+            if not 0 <= position < len(self.entries):
+                return None
+            
+            offset, length = self.entries[position]
+            if self.mapped is None:
+                with open(self.path, 'rb') as f:
+                    self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return self.mapped[offset:offset + length].decode('utf-8')
+
+    def find(self, task_id):
+        """
+        Return every archived JSON string recorded for task_id, oldest first
+        Time complexity: O(k) for k records with that task_id
+        """
+        with self.lock:
+            positions = list(self.index.get(task_id, []))
+        return [self.read(position) for position in positions]
+
+    def iter_page(self, offset=0, limit=100):
+        """Lazily yield archived JSON strings for one page"""
+        for position in range(max(offset, 0), min(offset + limit, len(self.entries))):
+            yield self.read(position)
+
+    def close(self):
+        """Drop the memory map so the next read sees appended data"""
+        with self.lock:
+            if self.mapped is not None:
+                self.mapped.close()
+                self.mapped = None
+
+    def size(self):
+        """Return number of archived tasks"""
+        return len(self.entries)
+
+class TodoDueScheduler:
+    """
+    Min-heap of task deadlines for reminders and overdue tracking
+    Stale entries (task updated or deleted) are skipped lazily and
+    the heap is compacted once they outnumber live entries
+    """
+    def __init__(self):
+        self.heap = []          # (due datetime, seq, node)
+        self.seq = 0            # Tie-breaker and entry version counter
+        self.live = 0           # Number of heap entries still valid
+        self.overdue = {}       # task_id -> node, in the order they became overdue
+
+    def reschedule(self, node):
+        """
+        Drop any existing entry for node and schedule its due_at
+        Time complexity: O(log n)
+        """
+        self.unschedule(node)
+        due = parse_due_at(node.due_at)
+        if due is None or node.completed:
+            return
+        
+        self.seq += 1
+        node.due_seq = self.seq
+        self.live += 1
+        heapq.heappush(self.heap, (due, self.seq, node))
+
+    def unschedule(self, node):
+        """
+        Invalidate node's heap entry and clear its overdue flag
+        Time complexity: O(1) amortised
+        """
+        if node.due_seq is not None:
+            node.due_seq = None
+            self.live -= 1
+            self.compact()
+        if self.overdue.pop(node.task_id, None) is not None:
+            node.overdue = False
+            node.json_cache = None
+
+    def compact(self):
+        """
+        Rebuild the heap without stale entries once they outnumber live ones
+        Time complexity: O(n), amortised over the stale entries removed
+        """
+        if len(self.heap) - self.live <= max(self.live, 64):
+            return
+        self.heap = [entry for entry in self.heap if entry[2].due_seq == entry[1]]
+        heapq.heapify(self.heap)
+
+    def tick(self, now=None):
+        """
+        Flip every task whose deadline has passed to overdue
+        Returns the newly overdue nodes so callers can send reminders
+        Time complexity: O(log n) amortised per task
+        """
+        now = now or datetime.now()
+        fired = []
+        
+        while self.heap and self.heap[0][0] <= now:
+            due, seq, node = heapq.heappop(self.heap)
+            # Skip entries invalidated by an update or delete
+            if node.due_seq != seq:
+                continue
+            node.due_seq = None
+            self.live -= 1
+            node.overdue = True
+            node.json_cache = None
+            self.overdue[node.task_id] = node
+            fired.append(node)
+            
+        return fired
+
+    def get_overdue(self):
+        """Return overdue nodes - O(k) for k overdue tasks"""
+        return list(self.overdue.values())
+
+    def get_due_within(self, until):
+        """
+        Return pending nodes due on or before until, earliest first
+        Walks only heap subtrees whose root is <= until, so cost
+        is proportional to the result (plus stale entries)
+        """
+        found = []
+        stack = [0] if self.heap else []
+        
+        while stack:
+            i = stack.pop()
+            due, seq, node = self.heap[i]
+            if due > until:
+                continue
+            if node.due_seq == seq:
+                found.append((due, seq, node))
+            # Children of heap index i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(self.heap):
+                    stack.append(child)
+        
+        found.sort(key=lambda entry: entry[:2])
+        return [node for due, seq, node in found]
+
 class TodoStack:
     """
     Stack implementation for undo operations
@@ -191,16 +563,30 @@ class TodoQueue:
     Queue implementation for task processing
     FIFO (First In, First Out) data structure
     """
-    def __init__(self):
-        self.queue = []     # Array-based queue
+    def __init__(self, max_size=None):
+        self.queue = []             # Array-based queue
+        self.max_size = max_size    # Optional limit, oldest items dropped first
 
     def enqueue(self, task):
         """
         Add task to rear of queue
-        Time complexity: O(1)
+        Time complexity: O(1), O(n) when dropping from a full queue
         """
+        # Remove oldest item if queue is full
+        if self.max_size is not None and len(self.queue) >= self.max_size:
+            self.queue.pop(0)
+            
         self.queue.append(task)
 
+    def drain(self):
+        """
+        Remove and return all items in FIFO order
+        Time complexity: O(1)
+        """
+        items = self.queue
+        self.queue = []
+        return items
+
     def dequeue(self):
         """
         Remove and return task from front of queue
@@ -224,14 +610,229 @@ class TodoQueue:
             return self.queue[0]
         return None
 
+class TokenBucket:
+    """
+    Token bucket rate limiter
+    Refills at rate tokens/second up to capacity; each request takes one token
+    """
+    def __init__(self, rate, capacity):
+        self.rate = rate                # Tokens added per second
+        self.capacity = capacity        # Maximum burst size
+        self.tokens = capacity          # Start full
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        """Add tokens earned since the last update"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now):
+        """Return 0 if a token is available, otherwise seconds until one is"""
+        self.refill(now)
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        """Remove one token (call only after wait_time returned 0)"""
+        self.tokens -= 1
+
+class AdmissionController:
+    """
+    Protects the single-process server from overload
+    - Per client, per route token buckets (429 when empty)
+    - Shared per-route token buckets for bulk routes across all clients
+    - Separate in-flight budgets for interactive and bulk requests
+      (503 when full), so bulk clients cannot starve interactive CRUD
+    """
+    def __init__(self, max_in_flight, max_bulk_in_flight, default_limit, route_limits,
+                 bulk_routes, max_buckets=10000):
+        self.max_in_flight = {              # Concurrent request budget per pool
+            'interactive': max_in_flight,
+            'bulk': max_bulk_in_flight
+        }
+        self.default_limit = default_limit  # (rate, capacity) for unlisted routes
+        self.route_limits = route_limits    # route -> per client (rate, capacity)
+        self.max_buckets = max_buckets      # Max tracked (client, route) pairs, LRU evicted
+        self.buckets = OrderedDict()        # (client, route) -> TokenBucket, oldest first
+        # Bulk route -> one TokenBucket shared by every client
+        self.route_buckets = {route: TokenBucket(*limit) for route, limit in bulk_routes.items()}
+        self.in_flight = {'interactive': 0, 'bulk': 0}
+        self.lock = threading.Lock()
+        self.counters = {
+            'admitted': 0,
+            'rate_limited': 0,
+            'shed_overload': 0,
+            'shed_bulk_overload': 0,
+            'buckets_evicted': 0,
+            'peak_in_flight': 0,
+            'peak_bulk_in_flight': 0
+        }
+
+    def get_client_bucket(self, client, route):
+        """Return the (client, route) bucket, evicting the LRU one if needed"""
+        key = (client, route)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            # Evict the least recently used bucket to stay within the bound
+            if len(self.buckets) >= self.max_buckets:
+                self.buckets.popitem(last=False)
+                self.counters['buckets_evicted'] += 1
+            rate, capacity = self.route_limits.get(route, self.default_limit)
+            bucket = self.buckets[key] = TokenBucket(rate, capacity)
+        else:
+            self.buckets.move_to_end(key)
+        return bucket
+
+    def admit(self, client, route):
+        """
+        Decide whether to accept a request
+        Returns (status, retry_after, pool): status is None when admitted,
+        and pool must then be passed to release()
+        """
+        now = time.monotonic()
+        pool = 'bulk' if route in self.route_buckets else 'interactive'
+        
+        with self.lock:
+            # Shed load first so overloaded servers answer cheaply
+            if self.in_flight[pool] >= self.max_in_flight[pool]:
+                self.counters['shed_bulk_overload' if pool == 'bulk' else 'shed_overload'] += 1
+                return 503, 1, pool
+            
+            # Check every bucket before taking tokens from any of them
+            buckets = [self.get_client_bucket(client, route)]
+            if pool == 'bulk':
+                buckets.append(self.route_buckets[route])
+            wait = max(bucket.wait_time(now) for bucket in buckets)
+            if wait:
+                self.counters['rate_limited'] += 1
+                return 429, max(1, math.ceil(wait)), pool
+            for bucket in buckets:
+                bucket.take()
+            
+            self.in_flight[pool] += 1
+            self.counters['admitted'] += 1
+            peak = 'peak_bulk_in_flight' if pool == 'bulk' else 'peak_in_flight'
+            self.counters[peak] = max(self.counters[peak], self.in_flight[pool])
+            return None, 0, pool
+
+    def release(self, pool):
+        """Mark an admitted request from pool as finished"""
+        with self.lock:
+            self.in_flight[pool] -= 1
+
+    def get_stats(self):
+        """Return counters for monitoring"""
+        with self.lock:
+            stats = dict(self.counters)
+            stats['in_flight'] = self.in_flight['interactive']
+            stats['max_in_flight'] = self.max_in_flight['interactive']
+            stats['bulk_in_flight'] = self.in_flight['bulk']
+            stats['max_bulk_in_flight'] = self.max_in_flight['bulk']
+            stats['tracked_buckets'] = len(self.buckets)
+        return stats
+
 # =====================================================
 # GLOBAL DATA STRUCTURES INITIALIZATION
 # =====================================================
 
 # Initialize main data structures
 todo_list = TodoLinkedList()        # Main storage using linked list
+IMPORT_BATCH_SIZE = 500             # Tasks inserted per batch during import
+
+# Cold storage for old completed tasks
+ARCHIVE_PATH = os.environ.get(
+    'TODO_ARCHIVE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'todo_archive.ndjson')
+)
+ARCHIVE_AGE_SECONDS = int(os.environ.get('TODO_ARCHIVE_AGE_SECONDS', 7 * 24 * 3600))
+MAX_ARCHIVE_PAGE = 500              # Largest archive page returned per request
+archive = TodoArchive(ARCHIVE_PATH)
 undo_stack = TodoStack()           # Undo operations using stack
 processing_queue = TodoQueue()     # Task processing using queue
+reminder_queue = TodoQueue(max_size=1000)  # Reminders fired for overdue tasks
+
+# Admission control: limits are (tokens per second, burst)
+admission = AdmissionController(
+    max_in_flight=int(os.environ.get('TODO_MAX_IN_FLIGHT', 32)),
+    max_bulk_in_flight=int(os.environ.get('TODO_MAX_BULK_IN_FLIGHT', 4)),
+    default_limit=(10, 20),
+    route_limits={
+        # Per client: bulk routes get a much smaller budget than interactive CRUD
+        'GET /api/tasks/export': (0.2, 2),
+        'POST /api/tasks/import': (0.2, 2),
+        'POST /api/tasks/archive': (0.5, 2)
+    },
+    bulk_routes={
+        # Shared by all clients; these routes use the bulk in-flight budget
+        'GET /api/tasks/export': (1, 4),
+        'POST /api/tasks/import': (1, 4),
+        'POST /api/tasks/archive': (1, 2)
+    }
+)
+ADMISSION_EXEMPT = {'GET /api/admission'}  # Monitoring must work under overload
+
+def run_due_scheduler():
+    """Advance the due date scheduler and queue reminders for new overdue tasks"""
+    for node in todo_list.scheduler.tick():
+        reminder_queue.enqueue({
+            'task_id': node.task_id,
+            'title': node.title,
+            'due_at': node.due_at,
+            'fired_at': datetime.now().isoformat()
+        })
+
+# =====================================================
+# ADMISSION CONTROL
+# =====================================================
+
+@app.before_request
+def admit_request():
+    """
+    Rate limit and bound concurrency before any route runs
+    Rejected requests get 429/503 with a Retry-After header
+    """
+    # CORS preflight and unknown routes are not limited
+    if request.method == 'OPTIONS' or request.url_rule is None:
+        return None
+    
+    route = f'{request.method} {request.url_rule.rule}'
+    if route in ADMISSION_EXEMPT:
+        return None
+    
+    status, retry_after, pool = admission.admit(request.remote_addr, route)
+    if status is None:
+        g.admission_pool = pool
+        return None
+    
+    error = 'Too many requests' if status == 429 else 'Server overloaded'
+    response = jsonify({'success': False, 'error': error})
+    response.status_code = status
+    response.headers['Retry-After'] = str(retry_after)
+    return response
+
+@app.after_request
+def hold_slot_while_streaming(response):
+    """
+    Streamed responses (export) keep their in-flight slot until the
+    last row is sent, so hand the release over to response close
+    """
+    if response.is_streamed and 'admission_pool' in g:
+        pool = g.pop('admission_pool')
+        response.call_on_close(lambda: admission.release(pool))
+    return response
+
+@app.teardown_request
+def release_slot(exc=None):
+    """Free the in-flight slot taken in admit_request (non-streamed or failed requests)"""
+    pool = g.pop('admission_pool', None)
+    if pool is not None:
+        admission.release(pool)
+
+@app.route('/api/admission', methods=['GET'])
+def get_admission_stats():
+    """Expose admission control counters for monitoring"""
+    return jsonify({'success': True, 'admission': admission.get_stats()})
 
 # =====================================================
 # API ENDPOINTS (CRUD OPERATIONS)
@@ -242,20 +843,227 @@ def get_tasks():
     """
     READ operation - Get all tasks
     Returns tasks sorted by priority and completion status
+    With ?include_archived=true also returns one page of archived tasks
+    (?archive_offset=, ?archive_limit=)
     """
     try:
-        # Get all tasks from linked list
-        tasks = todo_list.get_all_tasks()
+        # Refresh overdue flags before listing
+        run_due_scheduler()
+        
+        # Get all nodes from linked list
+        nodes = todo_list.get_all_nodes()
         
         # Sort tasks: incomplete first, then by priority
         priority_order = {'high': 1, 'medium': 2, 'low': 3}
-        tasks.sort(key=lambda x: (x['completed'], priority_order.get(x['priority'], 2)))
+        nodes.sort(key=lambda x: (x.completed, priority_order.get(x.priority, 2)))
+        
+        # Build response from each node's cached JSON fragment
+        body = (
+            '{"success": true, "tasks": ['
+            + ','.join(node.to_json() for node in nodes)
+            + '], "total": ' + str(len(nodes))
+        )
+        
+        # Page through the archive lazily if requested
+        if request.args.get('include_archived', '').lower() == 'true':
+            offset = request.args.get('archive_offset', 0, type=int)
+            # Cap the page so one request cannot pull the whole segment
+            limit = min(request.args.get('archive_limit', 100, type=int), MAX_ARCHIVE_PAGE)
+            body += (
+                ', "archived": ['
+                + ','.join(archive.iter_page(offset, limit))
+                + '], "archived_total": ' + str(archive.size())
+            )
+        
+        body += '}'
+        return Response(body, mimetype='application/json')
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/tasks/overdue', methods=['GET'])
+def get_overdue_tasks():
+    """
+    Get tasks whose due date has passed
+    Served from the scheduler's overdue index, not a list scan
+    """
+    try:
+        run_due_scheduler()
+        nodes = todo_list.scheduler.get_overdue()
+        
+        body = (
+            '{"success": true, "tasks": ['
+            + ','.join(node.to_json() for node in nodes)
+            + '], "total": ' + str(len(nodes)) + '}'
+        )
+        return Response(body, mimetype='application/json')
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/tasks/due', methods=['GET'])
+def get_due_tasks():
+    """
+    Get pending tasks due within ?within= seconds, earliest first
+    """
+    try:
+        within = request.args.get('within', type=int)
+        if within is None or within < 0:
+            return jsonify({'success': False, 'error': 'within must be a non-negative number of seconds'}), 400
+        
+        run_due_scheduler()
+        nodes = todo_list.scheduler.get_due_within(datetime.now() + timedelta(seconds=within))
+        
+        body = (
+            '{"success": true, "tasks": ['
+            + ','.join(node.to_json() for node in nodes)
+            + '], "total": ' + str(len(nodes)) + '}'
+        )
+        return Response(body, mimetype='application/json')
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/reminders', methods=['POST'])
+def collect_reminders():
+    """
+    Return and clear all reminders fired since the last call
+    Demonstrates draining a queue (FIFO) in one step
+    """
+    try:
+        run_due_scheduler()
+        reminders = reminder_queue.drain()
+        
+        return jsonify({
+            'success': True,
+            'reminders': reminders,
+            'total': len(reminders)
+        })
+        
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/tasks/archive', methods=['POST'])
+def archive_tasks():
+    """
+    Move completed tasks older than max_age_seconds into the archive
+    Keeps the live linked list small for every traversal
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        max_age = data.get('max_age_seconds', ARCHIVE_AGE_SECONDS)
+        
+        # Validate age (bool is an int subclass, so exclude it explicitly)
+        if isinstance(max_age, bool) or not isinstance(max_age, (int, float)) or max_age < 0:
+            return jsonify({'success': False, 'error': 'max_age_seconds must be a non-negative number'}), 400
+        
+        cutoff = datetime.now() - timedelta(seconds=max_age)
+        
+        moved = todo_list.archive_completed(archive, cutoff)
         
         return jsonify({
             'success': True,
-            'tasks': tasks,
-            'total': len(tasks)
+            'archived': moved,
+            'archived_total': archive.size(),
+            'message': f'Archived {moved} tasks'
         })
+        
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/tasks/export', methods=['GET'])
+def export_tasks():
+    """
+    Stream all tasks as NDJSON (one JSON object per line)
+    Uses a generator over the linked list so memory stays constant
+    """
+    def generate():
+        for node in todo_list.iter_nodes():
+            yield node.to_json() + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+VALID_PRIORITIES = {'low', 'medium', 'high'}
+
+def validate_import_row(data):
+    """
+    Check one parsed NDJSON row before it is inserted
+    Returns an error message, or None if the row is valid
+    """
+    if not isinstance(data, dict) or not data.get('title'):
+        return 'Title is required'
+    if not isinstance(data['title'], str) or not isinstance(data.get('description', ''), str):
+        return 'title and description must be strings'
+    if data.get('priority', 'medium') not in VALID_PRIORITIES:
+        return 'priority must be one of low, medium, high'
+    if not isinstance(data.get('completed', False), bool):
+        return 'completed must be true or false'
+    
+    # Timestamps must parse (aware values are converted to local time on insert)
+    try:
+        if data.get('created_at') is not None:
+            parse_timestamp(data['created_at'])
+    except (TypeError, ValueError):
+        return 'Invalid created_at'
+    try:
+        parse_due_at(data.get('due_at'))
+    except (TypeError, ValueError):
+        return 'Invalid due_at'
+        
+    return None
+
+@app.route('/api/tasks/import', methods=['POST'])
+def import_tasks():
+    """
+    Import tasks from an NDJSON upload
+    Parses the request stream line by line and inserts in batches
+    On a bad line the import stops with 400: every valid row before that
+    line is inserted and counted in 'imported', nothing after it is, so
+    a client can resume by re-sending from the failing line
+    Note: imported tasks get new IDs and are not logged to the undo stack
+    """
+    try:
+        batch = []
+        imported = 0
+        line_number = 0
+        
+        # Read the upload incrementally instead of loading it all
+        for raw_line in request.stream:
+            line_number += 1
+            line = raw_line.strip()
+            if not line:
+                continue
+            
+            try:
+                data = json.loads(line)
+                # Validate fields before anything is stored
+                error = validate_import_row(data)
+            except ValueError:
+                error = 'Invalid JSON'
+            
+            if error:
+                # Flush rows before the bad line so 'imported' is exact
+                if batch:
+                    imported += todo_list.add_tasks_batch(batch)
+                return jsonify({
+                    'success': False,
+                    'error': f'{error} (line {line_number})',
+                    'imported': imported,
+                    'failed_line': line_number
+                }), 400
+            
+            batch.append(data)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                imported += todo_list.add_tasks_batch(batch)
+                batch = []
+        
+        # Insert whatever is left over
+        if batch:
+            imported += todo_list.add_tasks_batch(batch)
+        
+        return jsonify({
+            'success': True,
+            'imported': imported,
+            'message': f'Imported {imported} tasks'
+        }), 201
+        
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -273,11 +1081,18 @@ def create_task():
         if not data or not data.get('title'):
             return jsonify({'success': False, 'error': 'Title is required'}), 400
         
+        # Validate optional due date
+        try:
+            parse_due_at(data.get('due_at'))
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'error': 'due_at must be an ISO 8601 datetime'}), 400
+        
         # Create new task in linked list
         new_task = todo_list.add_task(
             title=data['title'],
             description=data.get('description', ''),
-            priority=data.get('priority', 'medium')
+            priority=data.get('priority', 'medium'),
+            due_at=data.get('due_at')
         )
         
         # Log operation to undo stack
@@ -300,6 +1115,32 @@ def create_task():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/tasks/<int:task_id>', methods=['GET'])
+def get_task(task_id):
+    """
+    READ operation - Get one task by ID
+    Falls back to the archive's task_id index when the task is not live
+    """
+    try:
+        task_node = todo_list.find_task(task_id)
+        if task_node:
+            return jsonify({'success': True, 'task': task_node.to_dict(), 'archived': False})
+        
+        # IDs can repeat across restarts/imports, so return the latest record
+        records = archive.find(task_id)
+        if not records:
+            return jsonify({'success': False, 'error': 'Task not found'}), 404
+        
+        return jsonify({
+            'success': True,
+            'task': json.loads(records[-1]),
+            'archived': True,
+            'archived_matches': len(records)
+        })
+        
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/tasks/<int:task_id>', methods=['PUT'])
 def update_task(task_id):
     """
@@ -316,13 +1157,20 @@ def update_task(task_id):
         
         original_data = original_task.to_dict()
         
+        # Validate optional due date
+        try:
+            parse_due_at(data.get('due_at'))
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'error': 'due_at must be an ISO 8601 datetime'}), 400
+        
         # Update task in linked list
         updated_task = todo_list.update_task(
             task_id=task_id,
             title=data.get('title'),
             description=data.get('description'),
             priority=data.get('priority'),
-            completed=data.get('completed')
+            completed=data.get('completed'),
+            due_at=data.get('due_at')
         )
         
         if not updated_task:
@@ -409,7 +1257,8 @@ def undo_operation():
                 title=original['title'],
                 description=original['description'],
                 priority=original['priority'],
-                completed=original['completed']
+                completed=original['completed'],
+                due_at=original['due_at'] or ''
             )
             message = f"Undid update of task '{original['title']}'"
             
@@ -420,7 +1269,8 @@ def undo_operation():
             todo_list.add_task(
                 title=task_data['title'],
                 description=task_data['description'],
-                priority=task_data['priority']
+                priority=task_data['priority'],
+                due_at=task_data['due_at']
             )
             message = f"Undid deletion of task '{task_data['title']}'"
         
@@ -468,17 +1318,20 @@ def get_statistics():
     Shows usage of different data structures
     """
     try:
-        tasks = todo_list.get_all_tasks()
+        # Refresh overdue flags so overdue_tasks is current
+        run_due_scheduler()
+        
+        nodes = todo_list.get_all_nodes()
         
-        # Calculate statistics using array operations
-        total_tasks = len(tasks)
-        completed_tasks = len([t for t in tasks if t['completed']])
+        # Calculate statistics directly from nodes (no serialization)
+        total_tasks = len(nodes)
+        completed_tasks = len([n for n in nodes if n.completed])
         pending_tasks = total_tasks - completed_tasks
         
         # Priority distribution
         priority_count = {'high': 0, 'medium': 0, 'low': 0}
-        for task in tasks:
-            priority_count[task['priority']] += 1
+        for node in nodes:
+            priority_count[node.priority] += 1
         
         return jsonify({
             'success': True,
@@ -489,7 +1342,10 @@ def get_statistics():
                 'priority_distribution': priority_count,
                 'undo_operations_available': len(undo_stack.stack),
                 'tasks_in_processing_queue': processing_queue.size(),
-                'linked_list_size': todo_list.size
+                'linked_list_size': todo_list.size,
+                'archived_tasks': archive.size(),
+                'overdue_tasks': len(todo_list.scheduler.overdue),
+                'reminders_pending': reminder_queue.size()
             }
         })
         
@@ -0,0 +1,31 @@
+# bench_listing.py
+# Measures listing throughput of the backend in-process (no network).
+# Run from backend_mock_code/:  python bench_listing.py [task_count]
+# Compare results across commits with `git stash` / `git checkout`.
+import os
+import sys
+import tempfile
+import timeit
+
+# Keep the benchmark from touching the real archive file
+os.environ.setdefault('TODO_ARCHIVE_PATH', os.path.join(tempfile.mkdtemp(), 'archive.ndjson'))
+
+import To_do
+
+TASK_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+REPEAT = 10
+
+if __name__ == '__main__':
+    for i in range(TASK_COUNT):
+        To_do.todo_list.add_task(f"Task {i}", "desc " * 5, ["low", "medium", "high"][i % 3])
+
+    # Rate limiting would reject the repeated requests below
+    if hasattr(To_do, 'admission'):
+        To_do.admission.default_limit = (1e9, 1e9)
+
+    client = To_do.app.test_client()
+    print(f"{TASK_COUNT} tasks, mean of {REPEAT} requests")
+    for path in ['/api/tasks', '/api/stats']:
+        client.get(path)  # Warm up (fills the JSON cache where present)
+        seconds = timeit.timeit(lambda: client.get(path), number=REPEAT) / REPEAT
+        print(f"  GET {path:<12} {seconds * 1000:.1f} ms")